@@ -5,11 +5,19 @@ from optinist.api.utils.filepath_creater import (
     join_filepath
 )
 
+try:
+    from yaml import CDumper as Dumper
+except ImportError:
+    from yaml import Dumper
+
 
 class ConfigWriter:
+    # A larger buffer than the default keeps large workflow configs to a few write calls.
+    BUFFER_SIZE = 1 << 18
+
     @classmethod
     def write(cls, dirname, filename, config):
         create_directory(dirname)
 
-        with open(join_filepath([dirname, filename]), "w") as f:
-            yaml.dump(config, f)
+        with open(join_filepath([dirname, filename]), "w", buffering=cls.BUFFER_SIZE) as f:
+            yaml.dump(config, f, Dumper=Dumper)
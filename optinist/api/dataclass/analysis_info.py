@@ -1,4 +1,5 @@
 from enum import Enum
+import functools
 import json
 import os
 import re
@@ -13,6 +14,55 @@ The analysis info of a node in a workflow, which is used by the node to transmit
 """
 
 
+# The path of filemap.json as <project_root_dir>/filemap.json.
+# It is joined once here, and used by get_factors() to load the factors.
+# project_root_dir = get_project_root_dir(project_id)
+# FILEMAP_PATH = os.path.join(project_root_dir, 'filemap.json')
+# Dummy
+FILEMAP_PATH = os.path.join(os.path.dirname(__file__), r'../../../sample_data/cjs/1/filemap.json')
+
+
+@functools.lru_cache(maxsize=16)
+def load_factors(filemap_path: str, mtime: float) -> Dict[str, Dict]:
+    """
+    Get the between-factor and within-factor from filemap.json.
+    They are built only once as long as the file is not modified.
+    The result is shared between calls, so do not modify it.
+
+    [arguments]
+    mtime: The modification time of the file, which is used as a part of the cache key.
+
+    [Return]
+    factors_dict: Dict
+      '<between-factor name>': Dict
+        'file_path_list': The paths of the workflow input files belonging to the between-factor.
+        'within_factor': Dict
+          '<within-factor name>': Dict
+            file_path_list': The paths of the workflow input files belonging to
+            the between-factor and within-factor.
+    """
+
+    factors_dict = {}
+    with open(filemap_path) as file:
+        factors_info = json.load(file)
+
+    # Get the between-factor.
+    for between_factor in factors_info:
+        file_path_list = []
+        if 'images' in between_factor:
+            file_path_list = [file['path'] for file in between_factor['images']]
+        factors_dict[between_factor['folder_name']] = {'file_path_list': file_path_list, 'within_factor': {}}
+
+        # Get the within-factor in this between-factor if they are specified.
+        if 'sub_folders' in between_factor:
+            for within_factor in between_factor['sub_folders']:
+                file_path_list = [file['path'] for file in within_factor['images']]
+                factors_dict[between_factor['folder_name']]['within_factor'][within_factor['folder_name']] = \
+                    {'file_path': file_path_list}
+
+    return factors_dict
+
+
 class AnalysisStatus(Enum):
     """
     The enum to represent the analysis status for a workflow input file in a node.
@@ -76,19 +126,13 @@ class AnalysisInfo(BaseData):
 
     def __get_metadata(self, wf_input_path: str) -> Dict[str, str]:
         """
-        Get the names of subject, session, between-factor, and within-factor associated with the workflow input file.
+        Get the names of subject and session associated with the workflow input file.
+        The factors are looked up separately by get_factors(), so the filemap.json is not checked here.
 
         [Return]
         metadata: Dict
           'subject': Subject name.
           'session': Session name.
-          'factors': Dict
-            '<between-factor name>': Dict
-              'file_path_list': The paths of the workflow input files belonging to the between-factor.
-              'within_factor': Dict
-                '<within-factor name>': Dict
-                  file_path_list': The paths of the workflow input files belonging to
-                  the between-factor and within-factor.
         """
 
         metadata = {}
@@ -99,42 +143,15 @@ class AnalysisInfo(BaseData):
         metadata['subject'] = tokens[0].split('-')[1]
         metadata['session'] = tokens[1].split('-')[1]
 
-        # Set the path of filemap.json as <project_root_dir>/filemap.json.
-        # project_root_dir = get_project_root_dir(project_id)
-        # filemap_path = os.path.join(project_root_dir, 'filemap.json')
-        # Dummy
-        dir_path = os.path.dirname(__file__)
-        filemap_path = os.path.join(dir_path, r'../../../sample_data/cjs/1/filemap.json')
-
-        # Get the between-factor and within-factor from the filemap.json.
-        factors_dict = {}
-        with open(filemap_path) as file:
-            factors_info = json.load(file)
-
-            # Get the between-factor.
-            for between_factor in factors_info:
-                file_path_list = []
-                if 'images' in between_factor.keys():
-                    file_path_list = [file['path'] for file in between_factor['images']]
-                factors_dict[between_factor['folder_name']] = {'file_path_list': file_path_list, 'within_factor': {}}
-
-                # Get the within-factor in this between-factor if they are specified.
-                if 'sub_folders' in between_factor.keys():
-                    for within_factor in between_factor['sub_folders']:
-                        file_path_list = [file['path'] for file in within_factor['images']]
-                        factors_dict[between_factor['folder_name']]['within_factor'][within_factor['folder_name']] = \
-                            {'file_path': file_path_list}
-        metadata['factors'] = factors_dict
-
         return metadata
 
     def get_subject_list(self) -> List[str]:
-        subject_list = []
+        # A dict keeps the first-seen order, and checks duplicates without scanning the list.
+        subject_dict = {}
         for wf_input_path in self.__wf_input_file_path_list:
             metadata  = self.__get_metadata(wf_input_path)
-            if metadata['subject'] not in subject_list:
-                subject_list.append(metadata['subject'])
-        return subject_list
+            subject_dict[metadata['subject']] = None
+        return list(subject_dict)
 
     def get_subject(self, wf_input_path: str) -> str:
         metadata  = self.__get_metadata(wf_input_path)
@@ -146,14 +163,12 @@ class AnalysisInfo(BaseData):
         dict[<between-factor>, list[<within-factor>].
         """
 
-        factors_dict = {}
-        for wf_input_path in self.__wf_input_file_path_list:
-            metadata = self.__get_metadata(wf_input_path)
-            for between_factor in metadata['factors'].keys():
-                factors_dict[between_factor] = []
-                for within_factor in metadata['factors'][between_factor]['within_factor'].keys():
-                    factors_dict[between_factor].append(within_factor)
-        return factors_dict
+        # The factors are the same for all the workflow input files, so look them up only once.
+        if not self.__wf_input_file_path_list:
+            return {}
+
+        factors = load_factors(FILEMAP_PATH, os.path.getmtime(FILEMAP_PATH))
+        return {between_factor: list(info['within_factor']) for between_factor, info in factors.items()}
 
     def get_output_file_paths(self, wf_input_path: str) -> List[str]:
         """
@@ -178,7 +193,8 @@ class AnalysisInfo(BaseData):
 
         file_path_dict = {}
         for wf_input_path in wf_input_path_list:
-            if not wf_input_path_list or (wf_input_path_list and wf_input_path in self.__wf_input_file_path_list):
+            # The dict has the same keys as the workflow input file path list, and looks them up without a scan.
+            if not wf_input_path_list or (wf_input_path_list and wf_input_path in self.__unit_analysis_info_dict):
                 metadata = self.__get_metadata(wf_input_path)
                 if not subject_list or (subject_list and metadata['subject'] in subject_list):
                     file_path_dict[wf_input_path] = []
@@ -211,16 +227,12 @@ class AnalysisInfo(BaseData):
         message_dict = {}
         for wf_input_path in self.__wf_input_file_path_list:
             message = self.get_unit_analysis_status(wf_input_path)
-            if message not in message_dict.keys():
+            if message not in message_dict:
                 message_dict[message] = 1
             else:
                 message_dict[message] += 1
 
-        status_message = ''
-        for key, val in message_dict.items():
-            status_message += f'{key}: {str(val)} '
-
-        return status_message
+        return ''.join(f'{key}: {val} ' for key, val in message_dict.items())
 
     def get_message(self, wf_input_path: str) -> str:
         # Get the message such as an error message.
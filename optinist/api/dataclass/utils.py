@@ -1,6 +1,7 @@
 import copy
+import os
+
 import numpy as np
-import pathlib
 
 
 def create_images_list(data):
@@ -31,11 +32,14 @@ def check_path_format(paths):
     """
 
     if isinstance(paths, list):
-        output_paths = []
-        for path in paths:
-            output_paths.append(str(pathlib.Path(path).resolve()).replace('\\', '/'))
-        return output_paths
+        return [_format_path(path) for path in paths]
     elif isinstance(paths, str):
-        return str(pathlib.Path(paths).resolve()).replace('\\', '/')
+        return _format_path(paths)
     else:
         return None
+
+
+def _format_path(path):
+    # os.path.realpath() resolves the path in the same way as pathlib.Path.resolve(),
+    # but without constructing Path objects for every path in the list.
+    return os.path.realpath(path).replace('\\', '/')
@@ -42,7 +42,7 @@ class Runner:
                 input_info
             )
 
-            if 'analysis_info_out' in output_info.keys():
+            if 'analysis_info_out' in output_info:
                 # The function was added just after the node analysis, which updates experiment.yaml
                 # with the node analysis info such as output file paths and status.
                 cls.set_node_analysis_info(os.path.dirname(__rule.output), output_info['analysis_info_out'])
@@ -71,9 +71,11 @@ class Runner:
             gc.collect()
 
         except Exception as e:
+            # Only the last frame and the exception line are kept,
+            # so do not extract and format the whole stack.
             PickleWriter.write(
                 __rule.output,
-                list(traceback.TracebackException.from_exception(e).format())[-2:],
+                list(traceback.TracebackException.from_exception(e, limit=-1).format())[-2:],
             )
 
     @classmethod
@@ -105,7 +107,7 @@ class Runner:
             # For "subjects".
             # All the data are held in a form of List to support multiple workflow input files for a single subject.
             subject = analysis_info.get_subject(wf_input_path)
-            if subject in subject_dict.keys():
+            if subject in subject_dict:
                 subject_dict[subject]['success'].append(analysis_info.get_unit_analysis_status(wf_input_path))
                 subject_dict[subject]['output_path'].append(output_file_paths)
                 subject_dict[subject]['message'].append(analysis_info.get_message(wf_input_path))
@@ -117,13 +119,15 @@ class Runner:
                 }
 
         # Create an ExptFunction object for the node, and update the ExptConfig data.
+        # The node status summarizes all the workflow input files, so compute it once for both fields.
+        node_analysis_status = analysis_info.get_node_analysis_status()
         expt_function = expt_config.function
         expt_config.function[node_id] = ExptFunction(
             unique_id=expt_function[node_id].unique_id,
             name=expt_function[node_id].name,
-            success=analysis_info.get_node_analysis_status(),
+            success=node_analysis_status,
             hasNWB=expt_function[node_id].hasNWB,
-            message=analysis_info.get_node_analysis_status(),
+            message=node_analysis_status,
             outputPaths=output_path_dict,
             started_at=analysis_info.analysis_start_time,
             finished_at=analysis_info.analysis_end_time,
@@ -34,15 +34,19 @@ class WorkflowResult:
 
     def get(self, nodeIdList):
         results: Dict[str, Message] = {}
+
+        # The error log is shared by all the nodes, so check and read it only once.
+        error_message = ""
+        if os.path.exists(self.error_filepath):
+            error_message = Reader.read(self.error_filepath)
+
         for node_id in nodeIdList:
-            if os.path.exists(self.error_filepath):
-                error_message = Reader.read(self.error_filepath)
-                if error_message != "":
-                    results[node_id] = Message(
-                        status="error",
-                        message=error_message,
-                    )
-                
+            if error_message != "":
+                results[node_id] = Message(
+                    status="error",
+                    message=error_message,
+                )
+
             glob_pickle_filepath = join_filepath([
                 self.workflow_dirpath,
                 node_id,
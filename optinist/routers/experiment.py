@@ -1,4 +1,5 @@
 from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, status
 
@@ -13,6 +14,9 @@ from optinist.routers.model import DeleteItem
 
 router = APIRouter()
 
+# The maximum number of experiment directories removed at the same time.
+DELETE_MAX_WORKERS = 16
+
 
 @router.get(
     "/experiments/{project_id}",
@@ -91,11 +95,11 @@ async def delete_experiment(unique_id: str):
 
 @router.post("/experiments/delete", response_model=bool, tags=['experiments'])
 async def delete_experiment_list(deleteItem: DeleteItem):
+    # Each directory is a separate subtree, so they can be removed concurrently.
+    dirpath_list = [join_filepath([DIRPATH.OUTPUT_DIR, uid]) for uid in deleteItem.uidList]
     try:
-        [
-            shutil.rmtree(join_filepath([DIRPATH.OUTPUT_DIR, uid]))
-            for uid in deleteItem.uidList
-        ]
+        with ThreadPoolExecutor(max_workers=DELETE_MAX_WORKERS) as executor:
+            list(executor.map(shutil.rmtree, dirpath_list))
         return True
     except Exception as e:
         return False
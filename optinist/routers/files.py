@@ -1,6 +1,5 @@
 import os
-from glob import glob
-from typing import List
+from typing import List, Tuple
 from fastapi import APIRouter
 
 from optinist.api.dir_path import DIRPATH
@@ -14,46 +13,77 @@ class DirTreeGetter:
 
     @classmethod
     def get_tree(cls, file_types: List[str], dirname: str = None) -> List[TreeNode]:
+        nodes, _ = cls.__search_tree(file_types, dirname)
+        return nodes
+
+    @classmethod
+    def __search_tree(cls, file_types: List[str], dirname: str = None,
+                      parent_realpaths: frozenset = frozenset()) -> Tuple[List[TreeNode], bool]:
+        """
+        Get the tree nodes in a folder, and whether the folder has accepted files at any depth.
+        The accepted files are found in the same way as glob(): hidden files and folders are skipped,
+        folders with an accepted name are also matched, and folders that cannot be read are ignored.
+
+        [arguments]
+        parent_realpaths: The real paths of the folders above this one,
+        which stop the search at a symbolic link back to one of them.
+        """
+
         nodes: List[TreeNode] = []
+        has_accepted_files = False
 
         if dirname is None:
             absolute_dirpath = DIRPATH.INPUT_DIR
         else:
             absolute_dirpath = join_filepath([DIRPATH.INPUT_DIR, dirname])
 
-        for node_name in os.listdir(absolute_dirpath):
+        realpath = os.path.realpath(absolute_dirpath)
+        if realpath in parent_realpaths:
+            return nodes, has_accepted_files
+        parent_realpaths = parent_realpaths | {realpath}
+
+        # os.scandir() gets the file type along with the names, so no extra stat is needed for each entry.
+        try:
+            with os.scandir(absolute_dirpath) as entries:
+                entry_list = list(entries)
+        except OSError:
+            return nodes, has_accepted_files
+
+        file_extensions = tuple(file_types)
+
+        for entry in entry_list:
+            node_name = entry.name
+            is_accepted_name = node_name.endswith(file_extensions)
+            is_hidden = node_name.startswith('.')
+
+            if is_accepted_name and not is_hidden:
+                has_accepted_files = True
 
             if dirname is None:
                 relative_path = node_name
             else:
                 relative_path = join_filepath([dirname, node_name])
 
-            search_dirpath = join_filepath([absolute_dirpath, node_name])
-
-            if os.path.isfile(search_dirpath) and node_name.endswith(tuple(file_types)):
+            if entry.is_file() and is_accepted_name:
                 nodes.append(TreeNode(
                     path=relative_path,
                     name=node_name,
                     isdir=False,
                     nodes=[],
                 ))
-            elif os.path.isdir(search_dirpath) and len(cls.accept_files(search_dirpath, file_types)) > 0:
-                nodes.append(TreeNode(
-                    path=node_name,
-                    name=node_name,
-                    isdir=True,
-                    nodes=cls.get_tree(file_types, relative_path)
-                ))
-
-        return nodes
+            elif entry.is_dir():
+                # The subfolder is searched for accepted files while its nodes are listed,
+                # so it is scanned only once.
+                child_nodes, child_has_accepted_files = cls.__search_tree(
+                    file_types, relative_path, parent_realpaths)
+                if child_has_accepted_files:
+                    nodes.append(TreeNode(
+                        path=node_name,
+                        name=node_name,
+                        isdir=True,
+                        nodes=child_nodes
+                    ))
+                    if not is_hidden:
+                        has_accepted_files = True
 
-    @classmethod
-    def accept_files(cls, path: str, file_types: List[str]):
-        files_list = []
-        for file_type in file_types:
-            files_list.extend(glob(
-                join_filepath([path, "**", f"*{file_type}"]),
-                recursive=True
-            ))
-
-        return files_list
+        return nodes, has_accepted_files
@@ -1,5 +1,6 @@
 import os
 
+from optinist.api.config.config_reader import ConfigReader
 from optinist.api.config.config_writer import ConfigWriter
 from optinist.api.dir_path import DIRPATH
 from optinist.api.utils.filepath_creater import join_filepath
@@ -17,3 +18,4 @@ def test_config_writer():
     ConfigWriter.write(dirpath, filename, {"test": "test"})
 
     assert os.path.exists(filepath)
+    assert ConfigReader.read(filepath) == {"test": "test"}
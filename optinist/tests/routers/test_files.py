@@ -0,0 +1,74 @@
+import os
+
+from optinist.api.dir_path import DIRPATH
+from optinist.routers.files import DirTreeGetter
+
+file_path_list = [
+    'a/x.tif',
+    'n/m/x.tif',
+    'top.tif',
+    '.t.tif',
+    '.v/y.tif',
+    'g/.hidden.tif',
+    'h/.hd/z.tif',
+    'p/q.txt',
+]
+
+
+def get_names(nodes):
+    return sorted((node.name, node.isdir, get_names(node.nodes)) for node in nodes)
+
+
+def test_get_tree(tmp_path, monkeypatch):
+    for file_path in file_path_list:
+        os.makedirs(tmp_path / os.path.dirname(file_path), exist_ok=True)
+        (tmp_path / file_path).touch()
+    os.makedirs(tmp_path / 'k' / 'k.tif')
+    monkeypatch.setattr(DIRPATH, 'INPUT_DIR', str(tmp_path))
+
+    # Folders are listed if they have accepted files that glob() finds,
+    # which skips hidden files and folders and also matches folder names.
+    assert get_names(DirTreeGetter.get_tree(['.tif'])) == [
+        ('.t.tif', False, []),
+        ('.v', True, [('y.tif', False, [])]),
+        ('a', True, [('x.tif', False, [])]),
+        ('k', True, []),
+        ('n', True, [('m', True, [('x.tif', False, [])])]),
+        ('top.tif', False, []),
+    ]
+
+
+def test_get_tree_symlink_cycle(tmp_path, monkeypatch):
+    os.makedirs(tmp_path / 'a')
+    (tmp_path / 'a' / 'x.tif').touch()
+    os.makedirs(tmp_path / 'b')
+    (tmp_path / 'b' / 'y.tif').touch()
+    os.symlink('..', tmp_path / 'b' / 'up')
+    monkeypatch.setattr(DIRPATH, 'INPUT_DIR', str(tmp_path))
+
+    # The link back to the input folder is not followed again.
+    assert get_names(DirTreeGetter.get_tree(['.tif'])) == [
+        ('a', True, [('x.tif', False, [])]),
+        ('b', True, [('y.tif', False, [])]),
+    ]
+
+
+def test_get_tree_unreadable_folder(tmp_path, monkeypatch):
+    for file_path in ['a/x.tif', 'locked/y.tif']:
+        os.makedirs(tmp_path / os.path.dirname(file_path), exist_ok=True)
+        (tmp_path / file_path).touch()
+    monkeypatch.setattr(DIRPATH, 'INPUT_DIR', str(tmp_path))
+
+    # Permissions do not apply to root, so make the folder unreadable by failing os.scandir().
+    scandir = os.scandir
+
+    def scandir_without_locked(path):
+        if os.path.basename(path) == 'locked':
+            raise PermissionError(13, 'Permission denied', path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', scandir_without_locked)
+
+    assert get_names(DirTreeGetter.get_tree(['.tif'])) == [
+        ('a', True, [('x.tif', False, [])]),
+    ]
@@ -0,0 +1,36 @@
+import os
+
+import nibabel as nib
+import numpy as np
+
+from optinist.wrappers.vbm_wrapper import alignment
+from optinist.wrappers.vbm_wrapper.nifti_image import NiftiImage
+
+alignment_keys = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l']
+
+
+def create_params(image_id, translation):
+    values = [translation, 0, 0, 0.1, 0, 0, 1, 1, 1, 0, 0, 0]
+    return {'image_id': image_id, **dict(zip(alignment_keys, values))}
+
+
+def test_align_images_repeated_path(tmp_path, monkeypatch):
+    file_path = str(tmp_path.resolve() / 'sub-mouse1_ses-1_T2W.nii')
+    output_path = os.path.join(os.path.dirname(file_path), 'derivatives', 'alignment', 'sub-mouse1_ses-1_T2W.nii')
+    os.makedirs(os.path.dirname(output_path))
+    nib.save(nib.Nifti1Image(np.arange(60, dtype=np.int16).reshape(3, 4, 5), np.eye(4)), file_path)
+
+    # The output expected from the last parameters.
+    params_in = [create_params(image_id, image_id) for image_id in range(8)]
+    NiftiImage(file_path).update_affine_matrix(alignment.get_alignment_params(params_in[-1]))
+    expected_affine = nib.load(output_path).affine
+    os.remove(output_path)
+
+    # Every image ID is given the same workflow input file.
+    monkeypatch.setattr(alignment, 'get_wf_input_file_path', lambda image_id: file_path)
+    for _ in range(5):
+        analysis_info_out = alignment.align_images(params_in)['analysis_info_out']
+
+        assert analysis_info_out.get_unit_analysis_status(file_path) == 'success'
+        assert analysis_info_out.get_output_file_paths(file_path) == [file_path]
+        assert np.allclose(nib.load(output_path).affine, expected_affine)
@@ -0,0 +1,83 @@
+import os
+
+import nibabel as nib
+import numpy as np
+import pytest
+
+from optinist.wrappers.vbm_wrapper.nifti_image import NiftiImage
+
+alignment_params = (1, 2, 3, 0.1, 0.2, 0.3, 1.1, 0.9, 1, 0.01, 0, 0)
+
+
+def create_int16_scaled_image():
+    img = nib.Nifti1Image(np.arange(60, dtype=np.int16).reshape(3, 4, 5), np.diag([2, 2, 2, 1]))
+    img.header.set_slope_inter(0.5, 3)
+    return img
+
+
+def create_float32_extension_image():
+    img = nib.Nifti1Image(np.linspace(0, 1, 60, dtype=np.float32).reshape(3, 4, 5), np.eye(4))
+    img.header.extensions.append(nib.nifti1.Nifti1Extension('comment', b'alignment test'))
+    return img
+
+
+def create_uint8_micron_image():
+    img = nib.Nifti1Image(np.arange(60, dtype=np.uint8).reshape(3, 4, 5), np.eye(4))
+    img.header.set_xyzt_units('micron')
+    return img
+
+
+def create_int16_meter_image():
+    img = nib.Nifti1Image(np.arange(60, dtype=np.int16).reshape(3, 4, 5), np.eye(4))
+    img.header.set_xyzt_units('meter')
+    return img
+
+
+def read_header(file_path):
+    # Read the header as it is on the disk.
+    with open(file_path, 'rb') as file:
+        return nib.Nifti1Header.from_fileobj(file)
+
+
+@pytest.mark.parametrize('create_image', [
+    create_int16_scaled_image,
+    create_float32_extension_image,
+    create_uint8_micron_image,
+    create_int16_meter_image,
+])
+def test_save_header_only(tmp_path, create_image):
+    img = create_image()
+    os.makedirs(tmp_path / 'derivatives' / 'alignment')
+    file_path = str(tmp_path / 'image.nii')
+    nib.save(img, file_path)
+
+    # A compressed copy is saved by creating a new image, which gives the reference affine matrix.
+    nib.save(img, str(tmp_path / 'image.nii.gz'))
+    NiftiImage(str(tmp_path / 'image.nii.gz')).update_affine_matrix(alignment_params)
+    expected_affine = nib.load(str(tmp_path / 'derivatives' / 'alignment' / 'image.nii.gz')).affine
+
+    # An uncompressed file only has its header rewritten.
+    NiftiImage(file_path).update_affine_matrix(alignment_params)
+    output_path = str(tmp_path / 'derivatives' / 'alignment' / 'image.nii')
+
+    # The header must be the same as the one saved from a new image with the full data,
+    # except for the scaling, which nibabel calculates again when saving the full data.
+    input_img = nib.load(file_path)
+    reference_path = str(tmp_path / 'reference.nii')
+    nib.save(nib.Nifti1Image(input_img.get_fdata(), expected_affine, input_img.header), reference_path)
+
+    header = read_header(output_path)
+    reference_header = read_header(reference_path)
+    for key in header:
+        if key in ('scl_slope', 'scl_inter'):
+            continue
+        assert np.array_equal(header[key], reference_header[key]), key
+    assert header.extensions == read_header(file_path).extensions
+
+    # The image data are kept as they are, including the scaling.
+    output_img = nib.load(output_path)
+    assert np.allclose(output_img.affine, expected_affine)
+    assert output_img.header.get_slope_inter() == input_img.header.get_slope_inter()
+    assert output_img.get_data_dtype() == input_img.get_data_dtype()
+    assert np.array_equal(output_img.dataobj.get_unscaled(), input_img.dataobj.get_unscaled())
+    assert np.array_equal(output_img.get_fdata(), input_img.get_fdata())
@@ -1,7 +1,7 @@
-import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 from optinist.api.dataclass.dataclass import AnalysisInfo, AnalysisStatus
-from optinist.wrappers.vbm_wrapper.nifti_image import NiftiImage
 
 
 """ alignment.py
@@ -9,6 +9,10 @@ Update the affine transformation matrix in NIfTI files for given alignment.
 """
 
 
+# Get the 12 alignment parameters 'a' to 'l' from a parameter dict as a tuple.
+get_alignment_params = itemgetter('a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l')
+
+
 def align_images(
     # image_data: ImageData
     params_in: dict = None
@@ -21,41 +25,50 @@ def align_images(
     project_path = r'../../test_data/cjs/test_project'
     analysis_info_out = AnalysisInfo(wf_input_path_list, project_path)
 
-    # Update each NIfTI file.
-    # for wf_input_path, params in zip(wf_input_path_list, image_data.params):   DEBUG
-    for wf_input_path, params in zip(wf_input_path_list, params_in):
-        try:
-            # Set the alignment parameters.
-            alignment_params = np.array(
-                [params['a'],
-                 params['b'],
-                 params['c'],
-                 params['d'],
-                 params['e'],
-                 params['f'],
-                 params['g'],
-                 params['h'],
-                 params['i'],
-                 params['j'],
-                 params['k'],
-                 params['l']])
-
-            # Create a NiftiImage object.
-            nifti = NiftiImage(wf_input_path)
-
-            # Calculate a new affine transformation matrix, and overwrite the NIfTI file with the matrix.
-            nifti.update_affine_matrix(alignment_params)
-
-            # Set the same file path as output.
-            analysis_info_out.set_output_file_paths(wf_input_path, [wf_input_path])
-            analysis_info_out.set_analysis_status(wf_input_path, AnalysisStatus.PROCESSED)
-        except Exception as error:
-            analysis_info_out.set_analysis_status(wf_input_path, AnalysisStatus.ERROR)
-            analysis_info_out.set_message(wf_input_path, error.args[0])
+    # A workflow input file can be given more than once, and is saved to the same output file each time.
+    # Keep only its last parameters, which are the ones the file would end up with if processed in order,
+    # so that each output file is written by a single worker.
+    # params_dict = dict(zip(wf_input_path_list, image_data.params))   DEBUG
+    params_dict = dict(zip(wf_input_path_list, params_in))
+
+    # Update the NIfTI files in parallel, since each file is independent and the work is mostly file I/O.
+    # The AnalysisInfo object is only updated in this thread.
+    with ThreadPoolExecutor() as executor:
+        futures = {wf_input_path: executor.submit(update_nifti_file, wf_input_path, params)
+                   for wf_input_path, params in params_dict.items()}
+
+        for wf_input_path, future in futures.items():
+            try:
+                future.result()
+
+                # Set the same file path as output.
+                analysis_info_out.set_output_file_paths(wf_input_path, [wf_input_path])
+                analysis_info_out.set_analysis_status(wf_input_path, AnalysisStatus.PROCESSED)
+            except Exception as error:
+                analysis_info_out.set_analysis_status(wf_input_path, AnalysisStatus.ERROR)
+                analysis_info_out.set_message(wf_input_path, error.args[0])
 
     return {'analysis_info_out': analysis_info_out}
 
 
+def update_nifti_file(wf_input_path: str, params: dict):
+    """
+    Update the affine transformation matrix in a single NIfTI file with the alignment parameters.
+    """
+    # Import nibabel only when the node actually runs, as the other wrappers do for their libraries.
+    from optinist.wrappers.vbm_wrapper.nifti_image import NiftiImage
+
+    # Set the alignment parameters.
+    # A plain tuple is enough for 12 scalars, and is compared without creating an array.
+    alignment_params = get_alignment_params(params)
+
+    # Create a NiftiImage object.
+    nifti = NiftiImage(wf_input_path)
+
+    # Calculate a new affine transformation matrix, and overwrite the NIfTI file with the matrix.
+    nifti.update_affine_matrix(alignment_params)
+
+
 # DEBUG
 def get_wf_input_file_path(image_id):
     import os
@@ -1,10 +1,19 @@
 import math
 import os
+import shutil
 
 import nibabel as nib
 import numpy as np
 
 
+# The alignment parameters that leave the affine transformation matrix unchanged.
+IDENTITY_ALIGNMENT_PARAMS = (0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0)
+
+# The matrix that shifts the voxel indices by one as SPM12 does, which is the same for every file.
+VOXEL_INDEX_SHIFT_MATRIX = np.hstack((np.eye(4, 3), np.array([[-1, -1, -1, 1]]).T))
+VOXEL_INDEX_SHIFT_MATRIX.setflags(write=False)
+
+
 class NiftiImage:
     """
     Handle a NIfTI1-format image file and its image data.
@@ -16,8 +25,9 @@ class NiftiImage:
         file_path: The path of a NIfTI1-format image file.
         """
 
-        folder_path = os.path.join(os.path.dirname(file_path), 'derivatives', 'alignment')
-        self.save_file_path = os.path.join(folder_path, os.path.basename(file_path))
+        self.file_path = file_path
+        folder_path, file_name = os.path.split(file_path)
+        self.save_file_path = os.path.join(folder_path, 'derivatives', 'alignment', file_name)
 
         # Create the image object from the NIfTI file.
         self.img = nib.load(file_path)
@@ -33,16 +43,46 @@ class NiftiImage:
         """
 
         # Calculate a new affine transformation matrix.
-        current_matrix = self.__create_affine_matrix_from_params(alignment_params)
+        # The identity parameters do not change the matrix, so skip building and multiplying by it.
         previous_matrix = self.__get_affine_matrix_from_file()
-        new_affine_matrix = np.dot(current_matrix, previous_matrix)
+        if tuple(alignment_params) == IDENTITY_ALIGNMENT_PARAMS:
+            new_affine_matrix = previous_matrix
+        else:
+            current_matrix = self.__create_affine_matrix_from_params(alignment_params)
+            new_affine_matrix = np.dot(current_matrix, previous_matrix)
+
+        # Only the header changes, so an uncompressed single file is copied and only its header is rewritten.
+        if self.img.header.is_single and os.path.splitext(self.file_path)[1].lower() == '.nii':
+            self.__save_header_only(new_affine_matrix)
+            return
 
         # Update the image object with the new matrix.
-        self.img = nib.Nifti1Image(self.img.get_fdata(), new_affine_matrix, self.img.header)
+        # The data are passed as the array proxy, so they are not read as float64 and are saved in their own type.
+        self.img = nib.Nifti1Image(self.img.dataobj, new_affine_matrix, self.img.header)
 
         # Overwrite the NIfTI file.
         nib.save(self.img, self.save_file_path)
 
+    def __save_header_only(self, affine_matrix):
+        """
+        Save a copy of the NIfTI file whose header has the new affine transformation matrix.
+        The image data are not loaded, and are copied as they are.
+        """
+
+        # Read the header as it is on the disk, since the header of the loaded image
+        # has the data offset and scaling reset by nibabel.
+        with open(self.file_path, 'rb') as file:
+            header = self.img.header_class.from_fileobj(file)
+
+        # Set the matrix in the same way as nibabel does when creating an image with a new affine.
+        header.set_sform(affine_matrix, code='aligned')
+        header.set_qform(affine_matrix, code='unknown')
+
+        # The header and extensions keep their size, so the data part of the copy is left untouched.
+        shutil.copyfile(self.file_path, self.save_file_path)
+        with open(self.save_file_path, 'r+b') as file:
+            header.write_to(file)
+
     def __get_affine_matrix_from_file(self):
         """
         Get the affine transformation matrix from the file header.
@@ -50,12 +90,13 @@ class NiftiImage:
         """
 
         # Correct the affine transformation matrix.
-        affine_matrix = np.dot(self.img.affine, np.hstack((np.eye(4, 3), np.array([[-1, -1, -1, 1]]).T)))
+        affine_matrix = np.dot(self.img.affine, VOXEL_INDEX_SHIFT_MATRIX)
 
         # Scale the matrix.
         xyzt_units = self.__get_scale(self.img.header['xyzt_units'] & 7)
         if xyzt_units['scale'] > 0:
-            scaling_factor = np.diag(np.hstack((xyzt_units['scale'] * np.array([1, 1, 1]), 1)))
+            scale = xyzt_units['scale']
+            scaling_factor = np.diag((scale, scale, scale, 1))
             affine_matrix = np.dot(scaling_factor, affine_matrix)
 
         return affine_matrix
@@ -103,41 +144,31 @@ class NiftiImage:
           10: Y affine
           11: Z affine.
         The implementation is based on the spm_matrix() function of SPM12.
-        """
-
-        translation_matrix = np.array([[1, 0, 0, params[0]],
-                                       [0, 1, 0, params[1]],
-                                       [0, 0, 1, params[2]],
-                                       [0, 0, 0, 1]])
-
-        # Create the rotation matrix.
-        rotation_matrix_1 = np.array([[1, 0, 0, 0],
-                                      [0, math.cos(params[3]), math.sin(params[3]), 0],
-                                      [0, -math.sin(params[3]), math.cos(params[3]), 0],
-                                      [0, 0, 0, 1]])
-
-        rotation_matrix_2 = np.array([[math.cos(params[4]), 0, math.sin(params[4]), 0],
-                                      [0, 1, 0, 0],
-                                      [-math.sin(params[4]), 0, math.cos(params[4]), 0],
-                                      [0, 0, 0, 1]])
 
-        rotation_matrix_3 = np.array([[math.cos(params[5]), math.sin(params[5]), 0, 0],
-                                      [-math.sin(params[5]), math.cos(params[5]), 0, 0],
-                                      [0, 0, 1, 0],
-                                      [0, 0, 0, 1]])
-
-        rotation_matrix = rotation_matrix_1 @ rotation_matrix_2 @ rotation_matrix_3
-
-        scaling_matrix = np.array([[params[6], 0, 0, 0],
-                                   [0, params[7], 0, 0],
-                                   [0, 0, params[8], 0],
-                                   [0, 0, 0, 1]])
-
-        shear_matrix = np.array([[1, params[9], params[10], 0],
-                                 [0, 1, params[11], 0],
-                                 [0, 0, 1, 0],
-                                 [0, 0, 0, 1]])
+        The matrix is the product translation @ rotation_x @ rotation_y @ rotation_z @ scaling @ shear,
+        which is expanded here so that no intermediate 4x4 matrices are created.
+        """
 
-        affine_matrix = translation_matrix @ rotation_matrix @ scaling_matrix @ shear_matrix
+        cos_x, sin_x = math.cos(params[3]), math.sin(params[3])
+        cos_y, sin_y = math.cos(params[4]), math.sin(params[4])
+        cos_z, sin_z = math.cos(params[5]), math.sin(params[5])
+
+        # Rotation multiplied by scaling.
+        rs_00 = cos_y * cos_z * params[6]
+        rs_01 = cos_y * sin_z * params[7]
+        rs_02 = sin_y * params[8]
+        rs_10 = (-sin_x * sin_y * cos_z - cos_x * sin_z) * params[6]
+        rs_11 = (-sin_x * sin_y * sin_z + cos_x * cos_z) * params[7]
+        rs_12 = sin_x * cos_y * params[8]
+        rs_20 = (-cos_x * sin_y * cos_z + sin_x * sin_z) * params[6]
+        rs_21 = (-cos_x * sin_y * sin_z - sin_x * cos_z) * params[7]
+        rs_22 = cos_x * cos_y * params[8]
+
+        # Multiplied by shear, and translated.
+        affine_matrix = np.array([
+            [rs_00, rs_00 * params[9] + rs_01, rs_00 * params[10] + rs_01 * params[11] + rs_02, params[0]],
+            [rs_10, rs_10 * params[9] + rs_11, rs_10 * params[10] + rs_11 * params[11] + rs_12, params[1]],
+            [rs_20, rs_20 * params[9] + rs_21, rs_20 * params[10] + rs_21 * params[11] + rs_22, params[2]],
+            [0, 0, 0, 1]])
 
         return affine_matrix
@@ -1,4 +1,5 @@
 import csv
+import functools
 import json
 import os
 import shutil
@@ -25,9 +26,33 @@ def get_error_message(error):
     return error_message
 
 
+def get_file_name_without_extension(file_path):
+    """
+    Get the file name without its extension from a file path.
+    This is equivalent to os.path.splitext(os.path.basename(file_path))[0] with a single scan of the name.
+    """
+
+    file_name = file_path.rpartition(os.sep)[2]
+    if os.altsep:
+        file_name = file_name.rpartition(os.altsep)[2]
+
+    # Leading dots belong to the name, as in os.path.splitext().
+    dot_index = file_name.rfind('.')
+    if dot_index <= len(file_name) - len(file_name.lstrip('.')):
+        return file_name
+    return file_name[:dot_index]
+
+
 # Load a config file.
+# The parsed config is cached until the file is modified, and is shared between calls, so do not modify it.
 def load_config():
-    with open('config.json','r') as f:
+    config_path = os.path.abspath('config.json')
+    return read_config(config_path, os.path.getmtime(config_path))
+
+
+@functools.lru_cache(maxsize=8)
+def read_config(config_path, mtime):
+    with open(config_path, 'r') as f:
         config = json.load(f)
 
     return config
@@ -35,7 +60,7 @@ def load_config():
 
 # Create a command string for using SPM on MATLAB runtime.
 def create_matlab_cmd(spm_script_path, matlab_runtime_path):
-    return "{0} {1} script".format(spm_script_path, matlab_runtime_path)
+    return f'{spm_script_path} {matlab_runtime_path} script'
 
 
 # Get the BIDS root path.
@@ -68,11 +93,9 @@ def exist_data(bids_root_path, proc_name, subject_id=[]):
     if not os.path.isdir(target_dir):
         return False
     else:
-        file_list = os.listdir(target_dir)
-        if len(file_list) > 0:
-            return True
-        else:
-            return False
+        # Stop at the first entry instead of listing the whole folder.
+        with os.scandir(target_dir) as entries:
+            return next(entries, None) is not None
 
 
 # Remove output files in the derivative folder.
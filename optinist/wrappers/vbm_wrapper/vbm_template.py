@@ -3,6 +3,7 @@ import os
 from optinist.api.dir_path import DIRPATH
 
 from optinist.api.dataclass.dataclass import *
+from optinist.wrappers.vbm_wrapper.utility import get_file_name_without_extension
 
 """ vbm_template.py
 A workflow algorithm node template to be used in the voxel-based morphometry (VBM) analysis.
@@ -32,7 +33,7 @@ def vbm_template(
     output_file_path_dict = {}
     analysis_status_dict = {}
     for wf_input_path in wf_input_file_path_list:
-        input_file_name = os.path.splitext(os.path.basename(wf_input_path))[0]
+        input_file_name = get_file_name_without_extension(wf_input_path)
         folder_path = os.path.dirname(wf_input_path)
         output_file_path = os.path.join(folder_path, input_file_name + '_nodeA.nii')
         analysis_info.set_output_file_paths(wf_input_path, output_file_path)